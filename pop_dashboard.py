@@ -6,38 +6,47 @@ Modern, interactive system optimization dashboard with professional UI/UX
 """
 
 import os
+import types
+import errno
+import math
 import sys
 import subprocess
 import logging
+import signal
+import select
 import psutil
 import time
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional
 from dataclasses import dataclass
-from datetime import datetime
 import shutil
-import argparse
+import tempfile
+import copy
+import heapq
 import threading
 from collections import deque
+from array import array
+from functools import partial
+from itertools import islice
 import re
 
 
 # Rich imports for modern UI
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
-from rich.layout import Layout
-from rich.live import Live
 from rich.text import Text
 from rich.align import Align
-from rich.columns import Columns
-from rich.tree import Tree
 from rich.prompt import Prompt, Confirm
-from rich.status import Status
+from rich.markup import escape
 from rich import box
 from rich.theme import Theme
 
+# Only the live dashboard needs these; they are imported where it starts.
+# rich.progress (the backup progress bar) is likewise imported on use.
+if TYPE_CHECKING:
+    from rich.layout import Layout
+
 # Custom theme for professional look
 custom_theme = Theme({
     "info": "cyan",
@@ -62,7 +71,129 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-@dataclass
+MB = 1 << 20
+GB = 1 << 30
+GB_INV = 1.0 / GB  # Multiply by this instead of dividing by GB
+
+# Every possible progress bar, indexed by the number of filled cells
+BAR_WIDTH = 10
+PROGRESS_BARS = tuple("█" * filled + "░" * (BAR_WIDTH - filled) for filled in range(BAR_WIDTH + 1))
+
+# Color lookup tables: one byte per whole percentage 0..100 holding an index
+# into COLOR_NAMES, so thresholding a value is a single table lookup
+COLOR_NAMES = ("success", "warning", "error")
+
+def color_lut(warning: float, error: float) -> bytes:
+    """Build a lookup table for values above `warning`/`error` thresholds"""
+    return bytes(2 if pct > error else 1 if pct > warning else 0 for pct in range(101))
+
+def lut_color(lut: bytes, value: float) -> str:
+    """Look up the color of a percentage-like value"""
+    # ceil() keeps the strict `>` semantics: 80.5 lands on 81, 80.0 on 80
+    return COLOR_NAMES[lut[min(max(math.ceil(value), 0), 100)]]
+
+USAGE_COLORS = color_lut(60, 80)
+SWAP_COLORS = color_lut(10, 10)
+DISK_COLORS = color_lut(75, 90)
+TEMP_COLORS = color_lut(65, 80)
+PROC_CPU_COLORS = color_lut(20, 50)
+PROC_MEM_COLORS = color_lut(5, 10)
+
+def format_size(size: float) -> str:
+    """Format a byte count with binary units, as lsblk does (e.g. 256G, 1.8T)"""
+    for unit in ("B", "K", "M", "G", "T"):
+        if size < 1024 or unit == "T":
+            break
+        size /= 1024
+    return f"{size:.1f}".rstrip("0").rstrip(".") + unit
+
+# (key, label) rows of the system metrics panel; rows without a key are spacers
+METRICS_ROWS = (
+    ("cpu", "🔥 CPU Usage"),
+    ("freq", "⚡ CPU Frequency"),
+    ("load", "📊 Load Average"),
+    ("temp", "🌡️ Temperature"),
+    (None, ""),
+    ("memory", "💾 Memory"),
+    ("memory_size", "📏 Memory Size"),
+    ("swap", "🔄 Swap Usage"),
+    (None, ""),
+    ("disk", "💿 Disk Usage"),
+    ("disk_io", "📖 Disk I/O"),
+    ("network", "🌐 Network I/O"),
+    ("uptime", "⏰ Uptime"),
+)
+
+# Row labels of the detailed system information screen
+SYSINFO_CPU_MODEL = "🔥 CPU Model"
+SYSINFO_CPU_FREQ = "⚡ CPU Frequency"
+SYSINFO_TOTAL_MEM = "💾 Total Memory"
+SYSINFO_AVAILABLE_MEM = "💾 Available Memory"
+
+CPUINFO_MODEL_RE = re.compile(r"^model name\s*:\s*(.+)$", re.M)
+PRESET_VALUE_RE = re.compile(rb"^[ \t]*PRESET=(.*)$", re.M)  # Reading tolerates indentation
+PRESET_LINE_RE = re.compile(rb"^PRESET=.*$", re.M)
+
+# Preset descriptions, in menu order
+PRESETS = {
+    "working": {
+        "name": "🖥️  Working",
+        "desc": "Optimized for development and office work",
+        "details": [
+            "• Performance CPU governor",
+            "• Moderate memory settings", 
+            "• Development tools included",
+            "• Desktop animations disabled"
+        ]
+    },
+    "gaming": {
+        "name": "🎮 Gaming", 
+        "desc": "Optimized for maximum gaming performance",
+        "details": [
+            "• Performance CPU governor",
+            "• Aggressive memory settings",
+            "• Gaming tools included", 
+            "• Minimal background services"
+        ]
+    },
+    "server": {
+        "name": "🖥️  Server",
+        "desc": "Optimized for server/headless environments",
+        "details": [
+            "• Balanced CPU for server workloads",
+            "• Large network buffers",
+            "• Server tools included",
+            "• Desktop services disabled"
+        ]
+    },
+    "conservative": {
+        "name": "🛡️  Conservative",
+        "desc": "Minimal, safe optimizations",
+        "details": [
+            "• Safe CPU settings",
+            "• Minimal system changes",
+            "• Essential tools only",
+            "• Maximum compatibility"
+        ]
+    },
+    "custom": {
+        "name": "⚙️  Custom",
+        "desc": "Manual configuration of all settings",
+        "details": [
+            "• Configure each option manually",
+            "• Full control over optimizations",
+            "• Advanced users only"
+        ]
+    }
+}
+
+# Description and details of each preset, parsed once for the presets menu
+PRESET_DETAILS = {
+    key: Text.from_markup("\n".join(f"   [dim]{line}[/dim]" for line in [info["desc"], *info["details"]]) + "\n")
+    for key, info in PRESETS.items()
+}
+
+@dataclass(slots=True)
 class SystemMetrics:
     """System performance metrics"""
     cpu_percent: float = 0.0
@@ -85,7 +216,7 @@ class SystemMetrics:
         if self.load_avg is None:
             self.load_avg = [0.0, 0.0, 0.0]
 
-@dataclass
+@dataclass(slots=True)
 class OptimizationStatus:
     """Status of optimization modules"""
     cpu_boost: bool = False
@@ -98,103 +229,285 @@ class OptimizationStatus:
 class SystemMonitor:
     """Advanced system monitoring with real-time metrics"""
     
+    PROC_FILES = ("/proc/stat", "/proc/meminfo", "/proc/diskstats", "/proc/net/dev", "/proc/loadavg")
+    SECTOR_SIZE = 512  # /proc/diskstats always counts 512-byte sectors
+    HISTORY_SIZE = 60  # Samples kept in the CPU/memory ring buffers
+    MIN_SAMPLE_INTERVAL = 0.2  # seconds; shorter deltas give meaningless CPU%/rates
+    
     def __init__(self):
         self.metrics = SystemMetrics()
-        self.last_disk_io = psutil.disk_io_counters()
-        self.last_net_io = psutil.net_io_counters()
+        # Keep the /proc files open; every refresh re-reads them with pread()
+        self._proc_fds = {path: os.open(path, os.O_RDONLY) for path in self.PROC_FILES}
+        # Whole disks only, so partitions are not counted twice in the I/O totals
+        self._block_devices = {os.fsencode(name) for name in os.listdir("/sys/block")}
+        # Fixed for the lifetime of the process
+        self._cpu_count = psutil.cpu_count()
+        self._boot_time = psutil.boot_time()
+        # Without cpufreq (VMs, some ARM boards) psutil walks sysfs only to return None
+        self._cpu_freq_supported = psutil.cpu_freq() is not None
+        self._temp_fd = self._open_cpu_temp_sensor()
+        self._last_uptime_minute = -1  # The uptime string only changes once a minute
+        self.last_cpu_times = [0] * 8  # user .. steal jiffies
+        self.last_disk_io = None
+        self.last_net_io = None
         self.last_time = time.time()
-        self.cpu_history = deque(maxlen=60)  # Keep 60 seconds of CPU history
-        self.memory_history = deque(maxlen=60)
+        # Fixed-size ring buffers; _history_head is the slot the next sample goes to
+        self.cpu_history = array('f', bytes(4 * self.HISTORY_SIZE))
+        self.memory_history = array('f', bytes(4 * self.HISTORY_SIZE))
+        self._history_head = 0
+        self._read_proc_snapshot(self.metrics, 0)  # Prime the counters for the first refresh
     
-    def update_metrics(self):
-        """Update all system metrics with advanced monitoring"""
+    @staticmethod
+    def _open_cpu_temp_sensor() -> Optional[int]:
+        """Open the first input of the CPU hwmon sensor, or None if there is none"""
+        for hwmon in sorted(Path("/sys/class/hwmon").glob("hwmon*")):
+            try:
+                name = (hwmon / "name").read_text().strip().lower()
+            except OSError:
+                continue
+            if 'coretemp' in name or 'cpu' in name:
+                # temp1 (the package sensor on coretemp) first; a plain sort
+                # would put temp10_input ahead of it
+                inputs = sorted(hwmon.glob("temp[0-9]*_input"), key=lambda p: int(p.name[4:-6]))
+                if inputs:
+                    try:
+                        return os.open(inputs[0], os.O_RDONLY)
+                    except OSError:
+                        pass
+        return None
+    
+    def _read_proc(self, path: str) -> bytes:
+        """Read a whole /proc file through its persistent descriptor"""
+        fd = self._proc_fds[path]
+        data = b""
+        while True:
+            chunk = os.pread(fd, 65536, len(data))
+            if not chunk:
+                return data
+            data += chunk
+    
+    def _read_proc_snapshot(self, metrics: SystemMetrics, time_delta: float):
+        """Fill CPU, memory, I/O and load metrics from /proc in one pass"""
+        # Turns a byte-counter delta into MB/s with a single multiplication
+        rate_scale = 1.0 / (time_delta * MB) if time_delta > 0 else 0.0
+        
+        # CPU usage: busy share of the jiffies elapsed since the previous refresh
+        cpu_times = [int(v) for v in self._read_proc("/proc/stat").split(b"\n", 1)[0].split()[1:9]]
+        # Counters can step backwards (iowait notably does), so each field's
+        # delta is clamped at 0 as psutil does, keeping the share in 0..100
+        deltas = [max(0, now - last) for now, last in zip(cpu_times, self.last_cpu_times)]
+        total = sum(deltas)  # user .. steal
+        if total > 0:
+            idle = deltas[3] + deltas[4]  # idle + iowait
+            metrics.cpu_percent = 100.0 * (total - idle) / total
+        self.last_cpu_times = cpu_times
+        
+        # Memory metrics (values are in kB)
+        meminfo = {}
+        for line in self._read_proc("/proc/meminfo").splitlines():
+            key, value = line.split(b":", 1)
+            meminfo[key] = int(value.split()[0]) * 1024
+        mem_total = meminfo[b"MemTotal"]
+        mem_available = meminfo.get(b"MemAvailable", meminfo[b"MemFree"])
+        metrics.memory_percent = (mem_total - mem_available) / mem_total * 100
+        metrics.memory_available = mem_available * GB_INV
+        metrics.memory_total = mem_total * GB_INV
+        swap_total = meminfo[b"SwapTotal"]
+        metrics.swap_percent = (swap_total - meminfo[b"SwapFree"]) / swap_total * 100 if swap_total else 0.0
+        
+        # Disk I/O rates
+        read_sectors = write_sectors = 0
+        for line in self._read_proc("/proc/diskstats").splitlines():
+            fields = line.split()
+            if fields[2].replace(b"/", b"!") in self._block_devices:
+                read_sectors += int(fields[5])
+                write_sectors += int(fields[9])
+        current_disk_io = (read_sectors * self.SECTOR_SIZE, write_sectors * self.SECTOR_SIZE)
+        if self.last_disk_io and rate_scale:
+            metrics.disk_read_speed = (current_disk_io[0] - self.last_disk_io[0]) * rate_scale
+            metrics.disk_write_speed = (current_disk_io[1] - self.last_disk_io[1]) * rate_scale
+        self.last_disk_io = current_disk_io
+        
+        # Network I/O rates (the first two lines are headers)
+        bytes_recv = bytes_sent = 0
+        for line in self._read_proc("/proc/net/dev").splitlines()[2:]:
+            fields = line.split(b":", 1)[1].split()
+            bytes_recv += int(fields[0])
+            bytes_sent += int(fields[8])
+        current_net_io = (bytes_sent, bytes_recv)
+        if self.last_net_io and rate_scale:
+            metrics.network_sent = (current_net_io[0] - self.last_net_io[0]) * rate_scale
+            metrics.network_recv = (current_net_io[1] - self.last_net_io[1]) * rate_scale
+        self.last_net_io = current_net_io
+        
+        # Load average
+        metrics.load_avg = [float(v) for v in self._read_proc("/proc/loadavg").split()[:3]]
+    
+    def update_metrics(self) -> SystemMetrics:
+        """Update all system metrics with advanced monitoring, returning the new snapshot"""
         try:
             current_time = time.time()
             time_delta = current_time - self.last_time
+            if 0 <= time_delta < self.MIN_SAMPLE_INTERVAL:
+                # e.g. --status right after the counters were primed
+                time.sleep(self.MIN_SAMPLE_INTERVAL - time_delta)
+                current_time = time.time()
+                time_delta = current_time - self.last_time
             
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            self.metrics.cpu_percent = cpu_percent
-            self.cpu_history.append(cpu_percent)
-            
-            cpu_freq = psutil.cpu_freq()
-            self.metrics.cpu_freq = cpu_freq.current if cpu_freq else 0
-            self.metrics.cpu_cores = psutil.cpu_count()
-            
-            # Load average
-            if hasattr(os, 'getloadavg'):
-                self.metrics.load_avg = list(os.getloadavg())
-            
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            self.metrics.memory_percent = memory.percent
-            self.metrics.memory_available = memory.available / (1024**3)  # GB
-            self.metrics.memory_total = memory.total / (1024**3)  # GB
-            self.memory_history.append(memory.percent)
-            
-            swap = psutil.swap_memory()
-            self.metrics.swap_percent = swap.percent
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
-            self.metrics.disk_usage = disk.percent
+            # Fill a copy and publish it in one assignment, so readers on
+            # other threads never see a half-updated snapshot
+            metrics = copy.copy(self.metrics)
+            self._read_proc_snapshot(metrics, time_delta)
+            self.cpu_history[self._history_head] = metrics.cpu_percent
+            self.memory_history[self._history_head] = metrics.memory_percent
+            self._history_head = (self._history_head + 1) % self.HISTORY_SIZE
             
-            # Calculate disk I/O rates
-            current_disk_io = psutil.disk_io_counters()
-            if self.last_disk_io and time_delta > 0:
-                read_bytes = (current_disk_io.read_bytes - self.last_disk_io.read_bytes) / time_delta
-                write_bytes = (current_disk_io.write_bytes - self.last_disk_io.write_bytes) / time_delta
-                self.metrics.disk_read_speed = read_bytes / (1024**2)  # MB/s
-                self.metrics.disk_write_speed = write_bytes / (1024**2)  # MB/s
+            if self._cpu_freq_supported:
+                cpu_freq = psutil.cpu_freq()
+                metrics.cpu_freq = cpu_freq.current if cpu_freq else 0
+            metrics.cpu_cores = self._cpu_count
             
-            # Network I/O rates
-            current_net_io = psutil.net_io_counters()
-            if self.last_net_io and time_delta > 0:
-                sent_bytes = (current_net_io.bytes_sent - self.last_net_io.bytes_sent) / time_delta
-                recv_bytes = (current_net_io.bytes_recv - self.last_net_io.bytes_recv) / time_delta
-                self.metrics.network_sent = sent_bytes / (1024**2)  # MB/s
-                self.metrics.network_recv = recv_bytes / (1024**2)  # MB/s
+            # Disk metrics (same formula as psutil.disk_usage)
+            disk = os.statvfs('/')
+            disk_used = (disk.f_blocks - disk.f_bfree) * disk.f_frsize
+            disk_avail = disk.f_bavail * disk.f_frsize
+            metrics.disk_usage = disk_used / (disk_used + disk_avail) * 100 if disk_used + disk_avail else 0.0
             
             # System uptime
-            uptime_seconds = time.time() - psutil.boot_time()
-            hours, remainder = divmod(uptime_seconds, 3600)
-            minutes, _ = divmod(remainder, 60)
-            self.metrics.uptime = f"{int(hours)}h {int(minutes)}m"
+            uptime_minutes = int(current_time - self._boot_time) // 60
+            if uptime_minutes != self._last_uptime_minute:
+                hours, minutes = divmod(uptime_minutes, 60)
+                metrics.uptime = f"{hours}h {minutes}m"
+                self._last_uptime_minute = uptime_minutes
             
-            # Temperature (if available)
-            try:
-                temps = psutil.sensors_temperatures()
-                if temps:
-                    # Try to find CPU temperature
-                    for name, entries in temps.items():
-                        if 'coretemp' in name.lower() or 'cpu' in name.lower():
-                            if entries:
-                                self.metrics.temperature = entries[0].current
-                                break
-            except:
-                pass
+            # Temperature (if available), reported by hwmon in millidegrees
+            if self._temp_fd is not None:
+                try:
+                    metrics.temperature = int(os.pread(self._temp_fd, 16, 0)) / 1000.0
+                except (OSError, ValueError):
+                    pass
             
             # Update reference values
-            self.last_disk_io = current_disk_io
-            self.last_net_io = current_net_io
+            self.metrics = metrics
             self.last_time = current_time
             
         except Exception as e:
-            logger.error(f"Error updating metrics: {e}")
+            logger.error("Error updating metrics: %s", e)
+        return self.metrics
 
 class PopOsDashboard:
     """Professional Pop-OS Optimizer Dashboard"""
     
+    BOOST_PATH = "/sys/devices/system/cpu/cpufreq/boost"
+    GOVERNOR_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+    CUR_FREQ_PATH = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_cur_freq"
+    SWAPPINESS_PATH = "/proc/sys/vm/swappiness"
+    FSTRIM_WANTS_PATH = "/etc/systemd/system/timers.target.wants/fstrim.timer"
+    DESKTOP_SCHEMA = "org.gnome.desktop.interface"
+    PRESET_CONFIG_PATH = "scripts/config.sh"
+    OPT_STATUS_TTL = 10  # seconds between swappiness/TRIM/desktop probes
+    CLK_TCK = os.sysconf("SC_CLK_TCK")  # Unit of the CPU times in /proc/<pid>/stat
+    MIN_REFRESH = 0.5  # live refresh interval bounds (seconds), scaled by load
+    MAX_REFRESH = 4.0
+    MAX_IDLE_REFRESH = 10.0  # upper bound while CPU and memory usage hold steady
+    SCRIPT_OUTPUT_LINES = 200  # script output kept for the progress panel
+    
     def __init__(self):
         self.monitor = SystemMonitor()
         self.optimization_status = OptimizationStatus()
-        self.backup_dir = Path("backups")
+        self._cwd = Path.cwd()  # Scripts run from (and are found relative to) the startup directory
+        self._scripts_dir = self._cwd / "scripts"
+        self.backup_dir = self._cwd / "backups"
         self.backup_dir.mkdir(exist_ok=True)
         self.running = True
         self.refresh_rate = 2  # seconds
-        
+        self.adaptive_refresh = True  # False when a fixed --refresh-rate was given
+        self._idle_ticks = 0  # Consecutive samples without a noticeable change
+        self._last_activity: Optional[SystemMetrics] = None
+        self._prev_cpu_ticks: Dict[int, int] = {}  # pid -> utime + stime at the last process sample
+        self._proc_sample_time = time.monotonic()
+        self.top_processes: List[dict] = []  # Published by sample_top_processes()
+        
+        # Keep sysfs/procfs files open; they are re-read with pread() on every refresh
+        self._boost_fd = self._open_sysfs(self.BOOST_PATH)
+        self._gov_fd = self._open_sysfs(self.GOVERNOR_PATH)
+        self._swappiness_fd = self._open_sysfs(self.SWAPPINESS_PATH)
+        self._gov_files: Optional[List[str]] = None  # Per-core governor files, globbed on first use
+        self._cache: Dict[str, tuple] = {}  # key -> (value, monotonic expiry), see _cached()
+        self._opt_status_ts = 0.0  # Reset to 0 to force a full status re-check
+        self._preset_cache: Optional[tuple] = None  # ((mtime_ns, size) of config.sh, preset)
+        
+        # Tools that are missing on non-GNOME or non-systemd systems; checked
+        # once so their steps are skipped instead of failing a fork+exec each time
+        self._has_gsettings = shutil.which("gsettings") is not None
+        self._has_systemctl = shutil.which("systemctl") is not None
+        
+        # Panel titles are parsed from markup once instead of on every render
+        self._title_metrics = Text.from_markup("[cyan]📊 System Metrics[/cyan]")
+        self._title_status = Text.from_markup("[cyan]⚙️ Optimization Status[/cyan]")
+        self._title_processes = Text.from_markup("[cyan]🔍 Top Processes[/cyan]")
+        self._title_sysinfo = Text.from_markup("[cyan]💻 System Information[/cyan]")
+        self._title_storage = Text.from_markup("[cyan]💿 Storage Devices[/cyan]")
+        
+        # Panel chrome is built once; refreshes only replace the dynamic cells,
+        # and skip even that when the data is the same as in the last render
+        self._metrics_panel: Optional[Panel] = None
+        self._rendered_metrics: Optional[SystemMetrics] = None
+        self._rendered_status: Optional[OptimizationStatus] = None
+        self._processes_key: Optional[tuple] = None
+        self._build_status_panel()
+        self._build_processes_panel()
+        
+        # Keeps the menu's quick status metrics fresh while it waits for input
+        self._metrics_refresher: Optional[tuple] = None
+    
+    @staticmethod
+    def _open_sysfs(path: str) -> Optional[int]:
+        """Open a sysfs file for repeated reads, or None if unavailable"""
+        try:
+            return os.open(path, os.O_RDONLY)
+        except OSError:
+            return None
+    
+    @staticmethod
+    def _read_sysfs(fd: int, size: int = 16) -> Optional[str]:
+        """Read a sysfs value from an already open file descriptor"""
+        try:
+            return os.pread(fd, size, 0).decode().strip()
+        except OSError:
+            return None
+    
+    def _animations_enabled(self) -> Optional[bool]:
+        """Read GNOME's enable-animations setting, or None if unavailable"""
+        try:
+            from gi.repository import Gio
+        except ImportError:
+            # PyGObject is not importable (e.g. inside a virtualenv), use the CLI
+            if not self._has_gsettings:
+                return None
+            try:
+                result = self.run_command(["gsettings", "get", self.DESKTOP_SCHEMA, "enable-animations"], capture_output=True)
+                return "false" not in result.stdout.lower()
+            except (OSError, subprocess.SubprocessError):
+                return None
+        
+        # Gio.Settings.new() aborts the process on an unknown schema
+        source = Gio.SettingsSchemaSource.get_default()
+        if source is None or source.lookup(self.DESKTOP_SCHEMA, True) is None:
+            return None
+        return Gio.Settings.new(self.DESKTOP_SCHEMA).get_boolean("enable-animations")
 
     
+    def _cached(self, key: str, ttl: float, fn):
+        """Return fn()'s result, reusing it for `ttl` seconds"""
+        now = time.monotonic()
+        entry = self._cache.get(key)
+        if entry is not None and now < entry[1]:
+            return entry[0]
+        value = fn()
+        self._cache[key] = (value, now + ttl)
+        return value
+    
     def run_command(self, command: List[str], check: bool = True, capture_output: bool = True) -> subprocess.CompletedProcess:
         """Run command with error handling"""
         try:
@@ -207,245 +520,274 @@ class PopOsDashboard:
             )
             return result
         except subprocess.CalledProcessError as e:
-            logger.error(f"Command failed: {' '.join(command)}")
+            logger.error("Command failed: %s", ' '.join(command))
             if e.stderr:
-                logger.error(f"Error: {e.stderr}")
+                logger.error("Error: %s", e.stderr)
             raise
         except subprocess.TimeoutExpired:
-            logger.error(f"Command timed out: {' '.join(command)}")
+            logger.error("Command timed out: %s", ' '.join(command))
             raise
     
-    def check_optimization_status(self):
-        """Check current optimization status"""
+    def check_optimization_status(self) -> OptimizationStatus:
+        """Check current optimization status, returning the new snapshot"""
         try:
+            # Filled on a copy and published at the end, see update_metrics()
+            status = copy.copy(self.optimization_status)
+            
             # Check CPU boost
-            boost_path = Path("/sys/devices/system/cpu/cpufreq/boost")
-            if boost_path.exists():
-                self.optimization_status.cpu_boost = boost_path.read_text().strip() == "1"
+            if self._boost_fd is not None:
+                status.cpu_boost = self._read_sysfs(self._boost_fd) == "1"
             
             # Check CPU governor
-            gov_path = Path("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor")
-            if gov_path.exists():
-                self.optimization_status.cpu_governor = gov_path.read_text().strip()
-            
-            # Check memory optimizations
-            try:
-                sysctl_output = self.run_command(["sysctl", "vm.swappiness"], capture_output=True)
-                if "vm.swappiness = 10" in sysctl_output.stdout:
-                    self.optimization_status.memory_optimized = True
-            except:
-                pass
+            if self._gov_fd is not None:
+                governor = self._read_sysfs(self._gov_fd)
+                if governor:
+                    status.cpu_governor = governor
             
-            # Check SSD TRIM
-            try:
-                result = self.run_command(["systemctl", "is-enabled", "fstrim.timer"], capture_output=True)
-                self.optimization_status.ssd_optimized = result.returncode == 0
-            except:
-                pass
+            # The remaining settings only change when an optimization is
+            # applied, so they are refreshed on a TTL
+            now = time.monotonic()
+            if now - self._opt_status_ts >= self.OPT_STATUS_TTL:
+                self._opt_status_ts = now
                 
-            # Check desktop optimizations (simplified)
-            try:
-                result = self.run_command(["gsettings", "get", "org.gnome.desktop.interface", "enable-animations"], capture_output=True)
-                self.optimization_status.desktop_optimized = "false" in result.stdout.lower()
-            except:
-                pass
+                # Check memory optimizations
+                if self._swappiness_fd is not None:
+                    status.memory_optimized = self._read_sysfs(self._swappiness_fd) == "10"
+                
+                # Check SSD TRIM (enabling the timer links it into timers.target.wants)
+                status.ssd_optimized = os.path.exists(self.FSTRIM_WANTS_PATH)
+                    
+                # Check desktop optimizations (simplified)
+                animations = self._animations_enabled()
+                if animations is not None:
+                    status.desktop_optimized = not animations
+            
+            self.optimization_status = status
             
         except Exception as e:
-            logger.error(f"Error checking optimization status: {e}")
+            logger.error("Error checking optimization status: %s", e)
+        return self.optimization_status
     
-    def create_system_metrics_panel(self) -> Panel:
-        """Create beautiful system metrics panel"""
-        self.monitor.update_metrics()
-        metrics = self.metrics
+    def create_system_metrics_panel(self, metrics: Optional[SystemMetrics] = None) -> Panel:
+        """Create beautiful system metrics panel from a snapshot (default: the latest metrics)"""
+        if metrics is None:
+            metrics = self.metrics
         
-        # Create main table
-        table = Table(show_header=False, box=box.ROUNDED, padding=(0, 1))
-        table.add_column("Metric", style="cyan", min_width=15)
-        table.add_column("Value", style="white", min_width=20)
-        table.add_column("Status", style="white", min_width=15)
+        # The temperature row only exists when a sensor was found
+        with_temperature = bool(metrics.temperature)
+        if self._metrics_panel is None or with_temperature != self._metrics_has_temperature:
+            self._build_metrics_panel(with_temperature)
+        elif metrics is self._rendered_metrics:
+            return self._metrics_panel  # Snapshots are never mutated once published
+        self._rendered_metrics = metrics
+        table = self._metrics_table
+        rows = self._metrics_rows
         
         # CPU Section
-        cpu_color = "error" if metrics.cpu_percent > 80 else "warning" if metrics.cpu_percent > 60 else "success"
+        cpu_color = lut_color(USAGE_COLORS, metrics.cpu_percent)
         cpu_bar = self.create_progress_bar(metrics.cpu_percent, 100)
-        table.add_row(
-            "🔥 CPU Usage", 
-            f"[{cpu_color}]{metrics.cpu_percent:.1f}%[/{cpu_color}]",
-            cpu_bar
-        )
+        self._update_row(table, rows["cpu"], f"[{cpu_color}]{metrics.cpu_percent:.1f}%[/{cpu_color}]", cpu_bar)
         
-        table.add_row(
-            "⚡ CPU Frequency", 
-            f"{metrics.cpu_freq:.0f} MHz",
-            f"({metrics.cpu_cores} cores)"
-        )
+        self._update_row(table, rows["freq"], f"{metrics.cpu_freq:.0f} MHz", f"({metrics.cpu_cores} cores)")
         
-        if metrics.load_avg:
-            load_color = "error" if metrics.load_avg[0] > metrics.cpu_cores else "warning" if metrics.load_avg[0] > metrics.cpu_cores * 0.7 else "success"
-            table.add_row(
-                "📊 Load Average",
-                f"[{load_color}]{metrics.load_avg[0]:.2f}[/{load_color}]",
-                f"{metrics.load_avg[1]:.2f} {metrics.load_avg[2]:.2f}"
-            )
+        load_color = "error" if metrics.load_avg[0] > metrics.cpu_cores else "warning" if metrics.load_avg[0] > metrics.cpu_cores * 0.7 else "success"
+        self._update_row(
+            table, rows["load"],
+            f"[{load_color}]{metrics.load_avg[0]:.2f}[/{load_color}]",
+            f"{metrics.load_avg[1]:.2f} {metrics.load_avg[2]:.2f}"
+        )
         
         # Temperature
-        if metrics.temperature:
-            temp_color = "error" if metrics.temperature > 80 else "warning" if metrics.temperature > 65 else "success"
-            table.add_row(
-                "🌡️ Temperature",
-                f"[{temp_color}]{metrics.temperature:.1f}°C[/{temp_color}]",
-                ""
-            )
-        
-        table.add_row("", "", "")  # Spacer
+        if with_temperature:
+            temp_color = lut_color(TEMP_COLORS, metrics.temperature)
+            self._update_row(table, rows["temp"], f"[{temp_color}]{metrics.temperature:.1f}°C[/{temp_color}]", "")
         
         # Memory Section
-        mem_color = "error" if metrics.memory_percent > 80 else "warning" if metrics.memory_percent > 60 else "success"
+        mem_color = lut_color(USAGE_COLORS, metrics.memory_percent)
         mem_bar = self.create_progress_bar(metrics.memory_percent, 100)
-        table.add_row(
-            "💾 Memory",
-            f"[{mem_color}]{metrics.memory_percent:.1f}%[/{mem_color}]",
-            mem_bar
-        )
+        self._update_row(table, rows["memory"], f"[{mem_color}]{metrics.memory_percent:.1f}%[/{mem_color}]", mem_bar)
         
-        table.add_row(
-            "📏 Memory Size",
+        self._update_row(
+            table, rows["memory_size"],
             f"{metrics.memory_available:.1f}GB free",
             f"/ {metrics.memory_total:.1f}GB total"
         )
         
-        swap_color = "error" if metrics.swap_percent > 10 else "success"
+        swap_color = lut_color(SWAP_COLORS, metrics.swap_percent)
         swap_bar = self.create_progress_bar(metrics.swap_percent, 100)
-        table.add_row(
-            "🔄 Swap Usage",
-            f"[{swap_color}]{metrics.swap_percent:.1f}%[/{swap_color}]",
-            swap_bar
-        )
-        
-        table.add_row("", "", "")  # Spacer
+        self._update_row(table, rows["swap"], f"[{swap_color}]{metrics.swap_percent:.1f}%[/{swap_color}]", swap_bar)
         
         # Storage & Network
-        disk_color = "error" if metrics.disk_usage > 90 else "warning" if metrics.disk_usage > 75 else "success"
+        disk_color = lut_color(DISK_COLORS, metrics.disk_usage)
         disk_bar = self.create_progress_bar(metrics.disk_usage, 100)
-        table.add_row(
-            "💿 Disk Usage",
-            f"[{disk_color}]{metrics.disk_usage:.1f}%[/{disk_color}]",
-            disk_bar
-        )
+        self._update_row(table, rows["disk"], f"[{disk_color}]{metrics.disk_usage:.1f}%[/{disk_color}]", disk_bar)
         
-        table.add_row(
-            "📖 Disk I/O",
+        self._update_row(
+            table, rows["disk_io"],
             f"R: {metrics.disk_read_speed:.1f} MB/s",
             f"W: {metrics.disk_write_speed:.1f} MB/s"
         )
         
-        table.add_row(
-            "🌐 Network I/O",
+        self._update_row(
+            table, rows["network"],
             f"↓ {metrics.network_recv:.1f} MB/s",
             f"↑ {metrics.network_sent:.1f} MB/s"
         )
         
-        table.add_row(
-            "⏰ Uptime",
-            metrics.uptime,
-            ""
-        )
+        self._update_row(table, rows["uptime"], metrics.uptime, "")
         
-        return Panel(
+        return self._metrics_panel
+    
+    def _build_metrics_panel(self, with_temperature: bool):
+        """Build the static rows and chrome of the system metrics panel"""
+        table = Table(show_header=False, box=box.ROUNDED, padding=(0, 1))
+        table.add_column("Metric", style="cyan", min_width=15)
+        table.add_column("Value", style="white", min_width=20)
+        table.add_column("Status", style="white", min_width=15)
+        
+        self._metrics_rows = {}
+        for key, label in METRICS_ROWS:
+            if key == "temp" and not with_temperature:
+                continue
+            if key:
+                self._metrics_rows[key] = table.row_count
+            table.add_row(label, "", "")
+        
+        self._metrics_table = table
+        self._metrics_has_temperature = with_temperature
+        self._metrics_panel = Panel(
             table,
-                    title="[cyan]📊 System Metrics[/cyan]",
+                    title=self._title_metrics,
         title_align="left",
         border_style="cyan"
         )
     
-    def create_progress_bar(self, value: float, max_value: float, width: int = 10) -> str:
+    @staticmethod
+    def _update_row(table: Table, row: int, *cells: str):
+        """Replace the dynamic cells (all but the label column) of a table row"""
+        for column, cell in zip(table.columns[1:], cells):
+            column._cells[row] = cell
+    
+    def create_progress_bar(self, value: float, max_value: float, width: int = BAR_WIDTH) -> str:
         """Create a simple progress bar"""
-        percentage = min(value / max_value, 1.0)
+        percentage = min(max(value / max_value, 0.0), 1.0)
         filled = int(percentage * width)
-        bar = "█" * filled + "░" * (width - filled)
-        
-        if percentage > 0.8:
-            color = "error"
-        elif percentage > 0.6:
-            color = "warning"
-        else:
-            color = "success"
-            
+        bar = PROGRESS_BARS[filled] if width == BAR_WIDTH else "█" * filled + "░" * (width - filled)
+        color = lut_color(USAGE_COLORS, value * 100 / max_value)
         return f"[{color}]{bar}[/{color}]"
     
-    def create_optimization_status_panel(self) -> Panel:
-        """Create optimization status panel"""
-        self.check_optimization_status()
-        status = self.optimization_status
-        
-        table = Table(show_header=False, box=box.ROUNDED, padding=(0, 1))
-        table.add_column("Feature", style="cyan", min_width=18)
-        table.add_column("Status", style="white", min_width=15)
-        table.add_column("Details", style="dim", min_width=20)
+    def create_optimization_status_panel(self, status: Optional[OptimizationStatus] = None) -> Panel:
+        """Create optimization status panel from a snapshot (default: the latest status)"""
+        if status is None:
+            status = self.optimization_status
+        if status is self._rendered_status:
+            return self._status_panel
+        self._rendered_status = status
+        table = self._status_table
         
         # CPU Optimizations
         boost_status = "[success]✅ Enabled[/success]" if status.cpu_boost else "[error]❌ Disabled[/error]"
-        table.add_row("🔥 CPU Boost", boost_status, "Performance enhancement")
+        self._update_row(table, 0, boost_status)
         
         gov_color = "success" if status.cpu_governor == "performance" else "warning"
-        table.add_row("⚡ CPU Governor", f"[{gov_color}]{status.cpu_governor}[/{gov_color}]", "Frequency scaling")
+        self._update_row(table, 1, f"[{gov_color}]{status.cpu_governor}[/{gov_color}]")
         
         # Memory Optimization
         mem_status = "[success]✅ Optimized[/success]" if status.memory_optimized else "[error]❌ Default[/error]"
-        table.add_row("💾 Memory", mem_status, "Swappiness & caching")
+        self._update_row(table, 2, mem_status)
         
         # SSD Optimization
         ssd_status = "[success]✅ Enabled[/success]" if status.ssd_optimized else "[error]❌ Disabled[/error]"
-        table.add_row("💿 SSD TRIM", ssd_status, "Weekly maintenance")
+        self._update_row(table, 3, ssd_status)
         
         # Desktop Optimization
         desktop_status = "[success]✅ Optimized[/success]" if status.desktop_optimized else "[warning]⚠️ Default[/warning]"
-        table.add_row("🖥️ Desktop", desktop_status, "Animations & effects")
+        self._update_row(table, 4, desktop_status)
         
-        return Panel(
+        return self._status_panel
+    
+    def _build_status_panel(self):
+        """Build the static rows and chrome of the optimization status panel"""
+        table = Table(show_header=False, box=box.ROUNDED, padding=(0, 1))
+        table.add_column("Feature", style="cyan", min_width=18)
+        table.add_column("Status", style="white", min_width=15)
+        table.add_column("Details", style="dim", min_width=20)
+        
+        table.add_row("🔥 CPU Boost", "", "Performance enhancement")
+        table.add_row("⚡ CPU Governor", "", "Frequency scaling")
+        table.add_row("💾 Memory", "", "Swappiness & caching")
+        table.add_row("💿 SSD TRIM", "", "Weekly maintenance")
+        table.add_row("🖥️ Desktop", "", "Animations & effects")
+        
+        self._status_table = table
+        self._status_panel = Panel(
             table,
-                    title="[cyan]⚙️ Optimization Status[/cyan]",
+                    title=self._title_status,
         title_align="left", 
         border_style="cyan"
         )
     
-    def create_top_processes_panel(self) -> Panel:
-        """Create top processes panel"""
-        table = Table(show_header=True, box=box.ROUNDED, padding=(0, 1))
-        table.add_column("PID", style="dim", width=8)
-        table.add_column("Process", style="white", width=20)
-        table.add_column("CPU%", style="yellow", width=8)
-        table.add_column("Memory%", style="cyan", width=8)
-        table.add_column("Status", style="dim", width=10)
+    def sample_top_processes(self) -> List[dict]:
+        """Sample the 8 processes using the most CPU, returning the new list"""
+        # Top 8 by CPU usage, selected without sorting every process
+        top = heapq.nlargest(8, self._active_processes(), key=lambda item: item[0])
+        
+        # Only the rows shown need name, status and RSS; oneshot() reads
+        # them in one pass. RSS is scaled here because memory_percent()
+        # re-parses /proc/meminfo on every call.
+        mem_total = self.metrics.memory_total * GB
+        processes = []
+        for cpu_pct, pid in top:
+            try:
+                proc = psutil.Process(pid)
+                with proc.oneshot():
+                    processes.append({
+                        'pid': proc.pid,
+                        'name': proc.name(),
+                        'cpu_percent': cpu_pct,
+                        'memory_percent': proc.memory_info().rss * 100 / mem_total if mem_total else 0.0,
+                        'status': proc.status(),
+                    })
+            except psutil.Error:
+                continue
+        
+        self.top_processes = processes
+        return processes
+    
+    def create_top_processes_panel(self, processes: Optional[List[dict]] = None) -> Panel:
+        """Create top processes panel from a sample (default: the latest one)"""
+        if processes is None:
+            processes = self.top_processes
+        table = self._processes_table
         
         try:
-            processes = []
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent', 'status']):
-                try:
-                    info = proc.info
-                    if info and info.get('cpu_percent') is not None and info.get('cpu_percent', 0) > 0:
-                        processes.append(info)
-                except (psutil.NoSuchProcess, psutil.AccessDenied, psutil.ZombieProcess):
-                    pass
-            
-            # Sort by CPU usage
-            processes.sort(key=lambda x: x.get('cpu_percent', 0) or 0, reverse=True)
+            # Rows show one decimal, so smaller changes would not be visible
+            key = tuple(
+                (proc['pid'], round(proc['cpu_percent'], 1), round(proc['memory_percent'], 1), proc['status'])
+                for proc in processes
+            )
+            if key == self._processes_key:
+                return self._processes_panel
+            self._processes_key = key
+            self._clear_rows(table)
             
-            # Add processes to table (limit to top 8)
-            for proc in processes[:8]:
+            # Add processes to table
+            for proc in processes:
                 try:
-                    name = proc.get('name', 'Unknown')[:18] + "..." if len(proc.get('name', '')) > 18 else proc.get('name', 'Unknown')
-                    cpu_pct = proc.get('cpu_percent', 0) or 0
-                    mem_pct = proc.get('memory_percent', 0) or 0
+                    raw_name = proc['name'] or 'Unknown'
+                    name = raw_name[:15] + "..." if len(raw_name) > 18 else raw_name
+                    cpu_pct = proc['cpu_percent']
+                    mem_pct = proc['memory_percent']
                     
-                    cpu_color = "error" if cpu_pct > 50 else "warning" if cpu_pct > 20 else "success"
-                    mem_color = "error" if mem_pct > 10 else "warning" if mem_pct > 5 else "success"
+                    cpu_color = lut_color(PROC_CPU_COLORS, cpu_pct)
+                    mem_color = lut_color(PROC_MEM_COLORS, mem_pct)
                     
                     table.add_row(
-                        str(proc.get('pid', 'N/A')),
+                        str(proc['pid']),
                         name,
                         f"[{cpu_color}]{cpu_pct:.1f}[/{cpu_color}]",
                         f"[{mem_color}]{mem_pct:.1f}[/{mem_color}]",
-                        proc.get('status', 'unknown')
+                        proc['status']
                     )
                 except Exception:
                     # Skip problematic processes
@@ -457,11 +799,68 @@ class PopOsDashboard:
                 
         except Exception as e:
             # Fallback in case of major error
+            self._processes_key = None
+            self._clear_rows(table)
             table.add_row("ERROR", f"Process error: {str(e)[:15]}...", "0.0", "0.0", "error")
         
-        return Panel(
+        return self._processes_panel
+    
+    @staticmethod
+    def _clear_rows(table: Table):
+        """Drop all rows of a table, keeping its columns for reuse"""
+        table.rows.clear()
+        for column in table.columns:
+            column._cells.clear()
+    
+    def _active_processes(self) -> List[tuple]:
+        """List (cpu_percent, pid) of processes that used CPU since the last sample"""
+        # Reading /proc/<pid>/stat directly is much cheaper than building a
+        # psutil.Process for every PID when most of them are idle
+        now = time.monotonic()
+        elapsed = now - self._proc_sample_time
+        self._proc_sample_time = now
+        scale = 100.0 / (elapsed * self.CLK_TCK) if elapsed > 0 else 0.0
+        
+        prev_ticks = self._prev_cpu_ticks
+        ticks = {}
+        active = []
+        for entry in os.listdir("/proc"):
+            if not entry.isdigit():
+                continue
+            try:
+                fd = os.open(f"/proc/{entry}/stat", os.O_RDONLY)
+                try:
+                    data = os.read(fd, 1024)
+                finally:
+                    os.close(fd)
+            except OSError:
+                continue  # Exited since listdir()
+            
+            # The command name may contain spaces and ')', so split after the last ')'
+            fields = data[data.rindex(b")") + 2:].split()
+            pid = int(entry)
+            total = int(fields[11]) + int(fields[12])  # utime + stime
+            ticks[pid] = total
+            previous = prev_ticks.get(pid)
+            if previous is not None and total > previous:
+                active.append(((total - previous) * scale, pid))
+        
+        self._prev_cpu_ticks = ticks
+        return active
+    
+    def _build_processes_panel(self):
+        """Build the columns and chrome of the top processes panel"""
+        table = Table(show_header=True, box=box.ROUNDED, padding=(0, 1))
+        table.add_column("PID", style="dim", width=8)
+        table.add_column("Process", style="white", width=20)
+        table.add_column("CPU%", style="yellow", width=8)
+        table.add_column("Memory%", style="cyan", width=8)
+        table.add_column("Status", style="dim", width=10)
+        
+        self._processes_table = table
+        self._processes_panel = Panel(
             table,
-            title="[cyan]🔍 Top Processes[/cyan]",
+            title=self._title_processes,
             title_align="left",
             border_style="cyan"
         )
@@ -471,8 +870,10 @@ class PopOsDashboard:
         """Get current metrics"""
         return self.monitor.metrics
     
-    def create_dashboard_layout(self) -> Layout:
+    def create_dashboard_layout(self) -> "Layout":
         """Create the main dashboard layout"""
+        from rich.layout import Layout
+        
         layout = Layout()
         
         # Create main split
@@ -518,7 +919,9 @@ class PopOsDashboard:
         """Create dashboard footer with controls"""
         controls = [
             "[bold cyan]Ctrl+C[/bold cyan] Quit",
-            "[bold dim]Updates every 2 seconds[/bold dim]"
+            f"[bold dim]Updates every {self.MIN_REFRESH:g}-{self.MAX_IDLE_REFRESH:g} seconds (slower when idle or under load)[/bold dim]"
+            if self.adaptive_refresh else
+            f"[bold dim]Updates every {self.refresh_rate:g} seconds[/bold dim]"
         ]
         
         content = Align.center(" │ ".join(controls))
@@ -531,6 +934,8 @@ class PopOsDashboard:
     
     def run_live_dashboard(self):
         """Run the live dashboard"""
+        from rich.live import Live
+        
         try:
             layout = self.create_dashboard_layout()
             
@@ -541,40 +946,119 @@ class PopOsDashboard:
             # Initial update of dynamic panels
             self.monitor.update_metrics()
             self.check_optimization_status()
+            self.sample_top_processes()
             layout["metrics"].update(self.create_system_metrics_panel())
             layout["optimization"].update(self.create_optimization_status_panel())
             layout["processes"].update(self.create_top_processes_panel())
             
-            with Live(layout, refresh_per_second=1, screen=True) as live:
-                while self.running:
-                    try:
-                        # Update metrics first
-                        self.monitor.update_metrics()
-                        self.check_optimization_status()
-                        
-                        # Update dynamic panels
-                        layout["metrics"].update(self.create_system_metrics_panel())
-                        layout["optimization"].update(self.create_optimization_status_panel())
-                        layout["processes"].update(self.create_top_processes_panel())
-                        
-                        # Sleep for refresh rate
-                        time.sleep(self.refresh_rate)
+            # Renders are paced by an interval timer so their own duration does
+            # not add drift. SIGALRM is blocked before the sampler threads start
+            # (they inherit the mask) and consumed with sigwait() below. SIGINT
+            # is consumed the same way, so Ctrl+C ends the loop between frames
+            # instead of raising KeyboardInterrupt in the middle of a render.
+            # Everything after the handler install is undone by the finally
+            # below, so a failed setup cannot leave Ctrl+C blocked
+            wake_signals = {signal.SIGALRM, signal.SIGINT}
+            stop = threading.Event()
+            previous_alarm_handler = signal.signal(signal.SIGALRM, lambda *_: None)
+            try:
+                signal.pthread_sigmask(signal.SIG_BLOCK, wake_signals)
+                
+                # Metrics, optimization status and top processes are collected on
+                # background threads; the render loop only reads the latest published values
+                samplers = [
+                    threading.Thread(target=self._sample_periodically, args=(self.monitor.update_metrics, lambda: self.refresh_rate, stop), daemon=True),
+                    threading.Thread(target=self._sample_periodically, args=(self.check_optimization_status, lambda: self.OPT_STATUS_TTL, stop), daemon=True),
+                    threading.Thread(target=self._sample_periodically, args=(self.sample_top_processes, lambda: self.refresh_rate, stop), daemon=True),
+                ]
+                for sampler in samplers:
+                    sampler.start()
+                
+                signal.setitimer(signal.ITIMER_REAL, self.refresh_rate, self.refresh_rate)
+                # Redrawn only after the panels are updated, not on Rich's own timer
+                with Live(layout, auto_refresh=False, screen=True) as live:
+                    while self.running:
+                        try:
+                            # Update dynamic panels
+                            layout["metrics"].update(self.create_system_metrics_panel())
+                            layout["optimization"].update(self.create_optimization_status_panel())
+                            layout["processes"].update(self.create_top_processes_panel())
+                            live.refresh()
+                            
+                            self._adapt_refresh_rate()
+                            
+                        except Exception as e:
+                            logger.error("Dashboard update error: %s", e)
+                            # Continue running even with errors
                         
-                    except KeyboardInterrupt:
-                        self.running = False
-                        break
-                    except Exception as e:
-                        logger.error(f"Dashboard update error: {e}")
-                        # Continue running even with errors
-                        time.sleep(self.refresh_rate)
+                        # Wait for the next tick
+                        if signal.sigwait(wake_signals) == signal.SIGINT:
+                            self.running = False
+            finally:
+                stop.set()
+                signal.setitimer(signal.ITIMER_REAL, 0)
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, wake_signals)
+                signal.signal(signal.SIGALRM, previous_alarm_handler)
         except Exception as e:
-            logger.error(f"Dashboard initialization error: {e}")
+            logger.error("Dashboard initialization error: %s", e)
             console.print(f"[error]❌ Dashboard error: {e}[/error]")
             console.print("[warning]Try using --status or menu mode instead[/warning]")
     
+    def _adapt_refresh_rate(self):
+        """Back off the live refresh interval when the machine is busy or idle"""
+        if not self.adaptive_refresh:
+            return
+        metrics = self.monitor.metrics
+        if metrics is self._last_activity:
+            return  # No new sample since the last adjustment
+        
+        # Doubles for every sample in which CPU and memory usage held steady
+        previous = self._last_activity
+        if previous and abs(metrics.cpu_percent - previous.cpu_percent) < 2 and abs(metrics.memory_percent - previous.memory_percent) < 1:
+            self._idle_ticks = min(self._idle_ticks + 1, 5)
+        else:
+            self._idle_ticks = 0
+        self._last_activity = metrics
+        
+        interval = min(max(0.5 * metrics.cpu_percent / 25.0, self.MIN_REFRESH), self.MAX_REFRESH)
+        interval = round(min(interval * 2 ** self._idle_ticks, self.MAX_IDLE_REFRESH), 1)
+        if interval != self.refresh_rate:
+            self.refresh_rate = interval
+            signal.setitimer(signal.ITIMER_REAL, interval, interval)
+    
+    @staticmethod
+    def _sample_periodically(sample, interval: Callable[[], float], stop: threading.Event):
+        """Call sample() every interval() seconds until stop is set"""
+        while not stop.wait(interval()):
+            try:
+                sample()
+            except Exception as e:
+                logger.error("Background sampling error: %s", e)
+    
+    @staticmethod
+    def _copy_file(src: Path, dst: Path):
+        """Copy a file and its metadata, moving the data with sendfile()"""
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            size = os.fstat(fsrc.fileno()).st_size
+            offset = 0
+            try:
+                while offset < size:
+                    sent = os.sendfile(fdst.fileno(), fsrc.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+            except OSError as e:
+                if offset or e.errno not in (errno.EINVAL, errno.ENOSYS):
+                    raise
+                # sendfile() unsupported for these files: stream through a bounded buffer
+                shutil.copyfileobj(fsrc, fdst, length=MB)
+        shutil.copystat(src, dst)
+    
     def create_backup_with_progress(self) -> Path:
         """Create backup with progress indication"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+        
+        timestamp = time.strftime("%Y%m%d_%H%M%S")
         backup_path = self.backup_dir / f"optimization_backup_{timestamp}"
         backup_path.mkdir(exist_ok=True)
         
@@ -598,17 +1082,14 @@ class PopOsDashboard:
             for src, dst in backup_files:
                 progress.update(task, description=f"Backing up {src}")
                 try:
-                    src_path = Path(src)
-                    if src_path.exists():
-                        shutil.copy2(src_path, backup_path / dst)
-                        console.print(f"[success]✅ Backed up {src}[/success]")
-                    else:
-                        console.print(f"[warning]⚠️ Skipped {src} (not found)[/warning]")
+                    self._copy_file(Path(src), backup_path / dst)
+                    console.print(f"[success]✅ Backed up {src}[/success]")
+                except FileNotFoundError:
+                    console.print(f"[warning]⚠️ Skipped {src} (not found)[/warning]")
                 except Exception as e:
                     console.print(f"[error]❌ Failed to backup {src}: {e}[/error]")
                 
                 progress.advance(task)
-                time.sleep(0.1)  # Small delay for visual effect
         
         console.print(f"[success]✅ Backup completed: {backup_path}[/success]")
         return backup_path
@@ -620,13 +1101,12 @@ class PopOsDashboard:
         
         try:
             # Enable CPU boost if available
-            boost_path = Path("/sys/devices/system/cpu/cpufreq/boost")
-            if boost_path.exists():
+            if self._boost_fd is not None:
                 try:
                     # Use a simpler approach without subprocess timeout issues
                     console.print("[info]Setting CPU boost...[/info]")
                     result = subprocess.run(
-                        ["sudo", "tee", str(boost_path)], 
+                        ["sudo", "tee", self.BOOST_PATH], 
                         input="1\n", 
                         text=True, 
                         capture_output=True, 
@@ -643,26 +1123,33 @@ class PopOsDashboard:
             
             # Set performance governor
             console.print("[info]Setting CPU governor to performance...[/info]")
-            gov_files = list(Path("/sys/devices/system/cpu").glob("cpu*/cpufreq/scaling_governor"))
+            if self._gov_files is None:
+                self._gov_files = [str(path) for path in sorted(Path("/sys/devices/system/cpu").glob("cpu*/cpufreq/scaling_governor"))]
             success_count = 0
             
-            for gov_file in gov_files[:4]:  # Limit to first 4 cores to avoid too many prompts
+            # A single tee writes every core's governor: one sudo prompt, one process
+            if self._gov_files:
                 try:
                     result = subprocess.run(
-                        ["sudo", "tee", str(gov_file)], 
+                        ["sudo", "tee", *self._gov_files], 
                         input="performance\n", 
                         text=True, 
                         capture_output=True, 
                         timeout=10
                     )
                     if result.returncode == 0:
-                        success_count += 1
+                        success_count = len(self._gov_files)
+                    else:
+                        # tee names each file it could not write; no names means sudo itself failed
+                        failed = sum(1 for gov_file in self._gov_files if gov_file in result.stderr)
+                        success_count = len(self._gov_files) - failed if failed else 0
                 except subprocess.TimeoutExpired:
-                    console.print(f"[warning]⚠️ Timeout setting governor for {gov_file.name}[/warning]")
-                    break
+                    console.print("[warning]⚠️ Timeout setting CPU governor[/warning]")
                 except Exception:
                     pass
             
+            self._opt_status_ts = 0.0  # Force a status re-check
+            
             if success_count > 0:
                 console.print(f"[success]✅ Performance governor set for {success_count} cores[/success]")
                 console.print("[info]Note: Some cores may require manual configuration[/info]")
@@ -691,25 +1178,31 @@ class PopOsDashboard:
         
         success_count = 0
         
-        for setting in sysctl_settings:
-            console.print(f"[info]Applying {setting}...[/info]")
-            try:
-                result = subprocess.run(
-                    ["sudo", "sysctl", "-w", setting], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=10
-                )
-                if result.returncode == 0:
+        # One sysctl call for all settings; it echoes "key = value" for each
+        # setting it applied and reports the failed ones on stderr
+        console.print(f"[info]Applying {len(sysctl_settings)} memory settings...[/info]")
+        try:
+            result = subprocess.run(
+                ["sudo", "sysctl", "-w", *sysctl_settings], 
+                capture_output=True, 
+                text=True, 
+                timeout=10
+            )
+            applied = {line.split("=", 1)[0].strip() for line in result.stdout.splitlines() if "=" in line}
+            for setting in sysctl_settings:
+                if setting.split("=", 1)[0] in applied:
                     console.print(f"[success]✅ Applied: {setting}[/success]")
                     success_count += 1
                 else:
-                    console.print(f"[warning]⚠️ Failed to apply {setting}: {result.stderr}[/warning]")
-            except subprocess.TimeoutExpired:
-                console.print(f"[warning]⚠️ Timeout applying {setting}[/warning]")
-                break
-            except Exception as e:
-                console.print(f"[warning]⚠️ Failed to apply {setting}: {e}[/warning]")
+                    console.print(f"[warning]⚠️ Failed to apply {setting}[/warning]")
+            if result.stderr:
+                console.print(f"[warning]⚠️ {result.stderr.strip()}[/warning]")
+        except subprocess.TimeoutExpired:
+            console.print("[warning]⚠️ Timeout applying memory settings[/warning]")
+        except Exception as e:
+            console.print(f"[warning]⚠️ Failed to apply memory settings: {e}[/warning]")
+        
+        self._opt_status_ts = 0.0  # Force a status re-check
         
         if success_count > 0:
             console.print(f"[success]✅ Applied {success_count}/{len(sysctl_settings)} memory optimizations[/success]")
@@ -728,17 +1221,14 @@ class PopOsDashboard:
         try:
             # Enable TRIM
             console.print("[info]Enabling automatic TRIM...[/info]")
-            result = subprocess.run(
-                ["sudo", "systemctl", "enable", "fstrim.timer"], 
-                capture_output=True, 
-                text=True, 
-                timeout=10
-            )
-            if result.returncode == 0:
-                console.print("[success]✅ Automatic TRIM enabled[/success]")
-                success_count += 1
+            if not self._has_systemctl:
+                console.print("[warning]⚠️ systemctl not found, skipping TRIM timer[/warning]")
             else:
-                console.print("[warning]⚠️ Could not enable TRIM[/warning]")
+                if self._spawn(["sudo", "systemctl", "enable", "fstrim.timer"], 10) == 0:
+                    console.print("[success]✅ Automatic TRIM enabled[/success]")
+                    success_count += 1
+                else:
+                    console.print("[warning]⚠️ Could not enable TRIM[/warning]")
             
             # Set I/O scheduler for NVMe drives
             console.print("[info]Setting I/O scheduler for NVMe drives...[/info]")
@@ -760,6 +1250,7 @@ class PopOsDashboard:
                 except Exception:
                     pass
             
+            self._opt_status_ts = 0.0  # Force a status re-check
             console.print(f"[success]✅ SSD optimization completed ({success_count} operations)[/success]")
             return success_count > 0
             
@@ -771,40 +1262,40 @@ class PopOsDashboard:
         """Optimize desktop with progress indication"""
         console.print("[info]Optimizing desktop environment...[/info]")
         
+        if not self._has_gsettings:
+            console.print("[warning]⚠️ gsettings not found, skipping desktop optimization[/warning]")
+            return False
+        
         success_count = 0
         
+        # All settings are applied by one shell, which reports each step's
+        # exit status; the fixed workspace count only applies once dynamic
+        # workspaces are off
+        script = (
+            "gsettings set org.gnome.desktop.interface enable-animations false; echo animations=$?; "
+            "gsettings set org.gnome.mutter dynamic-workspaces false && "
+            "gsettings set org.gnome.desktop.wm.preferences num-workspaces 6; echo workspaces=$?"
+        )
+        
         try:
-            # Disable animations
-            console.print("[info]Disabling desktop animations...[/info]")
+            console.print("[info]Disabling desktop animations and setting workspace configuration...[/info]")
             result = subprocess.run(
-                ["gsettings", "set", "org.gnome.desktop.interface", "enable-animations", "false"], 
+                ["sh", "-c", script], 
                 capture_output=True, 
                 text=True, 
-                timeout=5
+                timeout=10
             )
-            if result.returncode == 0:
+            steps = dict(line.split("=", 1) for line in result.stdout.splitlines() if "=" in line)
+            
+            if steps.get("animations") == "0":
                 console.print("[success]✅ Desktop animations disabled[/success]")
                 success_count += 1
             
-            # Set number of workspaces
-            console.print("[info]Setting workspace configuration...[/info]")
-            result = subprocess.run(
-                ["gsettings", "set", "org.gnome.mutter", "dynamic-workspaces", "false"], 
-                capture_output=True, 
-                text=True, 
-                timeout=5
-            )
-            if result.returncode == 0:
-                result = subprocess.run(
-                    ["gsettings", "set", "org.gnome.desktop.wm.preferences", "num-workspaces", "6"], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=5
-                )
-                if result.returncode == 0:
-                    console.print("[success]✅ Workspace configuration optimized[/success]")
-                    success_count += 1
+            if steps.get("workspaces") == "0":
+                console.print("[success]✅ Workspace configuration optimized[/success]")
+                success_count += 1
             
+            self._opt_status_ts = 0.0  # Force a status re-check
             console.print(f"[success]✅ Desktop optimization completed ({success_count} operations)[/success]")
             return success_count > 0
             
@@ -822,18 +1313,26 @@ class PopOsDashboard:
             "avahi-daemon.service"
         ]
         
+        if not self._has_systemctl:
+            console.print("[warning]⚠️ systemctl not found, skipping services optimization[/warning]")
+            return False
+        
         success_count = 0
         
+        # systemctl takes every unit at once; only when that fails are the
+        # units retried one by one to find out which could not be disabled
+        try:
+            console.print(f"[info]Disabling {', '.join(services_to_disable)}...[/info]")
+            returncode = self._spawn(["sudo", "systemctl", "disable", *services_to_disable], 10)
+            batch_ok = returncode == 0
+        except Exception:
+            batch_ok = False
+        
         for service in services_to_disable:
             try:
-                console.print(f"[info]Disabling {service}...[/info]")
-                result = subprocess.run(
-                    ["sudo", "systemctl", "disable", service], 
-                    capture_output=True, 
-                    text=True, 
-                    timeout=10
-                )
-                if result.returncode == 0:
+                if not batch_ok:
+                    returncode = self._spawn(["sudo", "systemctl", "disable", service], 10)
+                if returncode == 0:
                     console.print(f"[success]✅ Disabled {service}[/success]")
                     success_count += 1
                 else:
@@ -844,18 +1343,69 @@ class PopOsDashboard:
         console.print(f"[success]✅ Services optimization completed ({success_count} services)[/success]")
         return success_count > 0
     
-    def run_script_with_progress(self, script_name: str, description: str) -> bool:
+    def run_steps(self, steps, sequential: bool = False) -> List[bool]:
+        """Run independent optimization steps, concurrently unless `sequential`"""
+        if not sequential:
+            # Authenticate once up front so the steps' sudo calls do not all
+            # prompt for a password on the same terminal at the same time
+            sequential = not self._authenticate_sudo()
+        
+        if sequential:
+            return [step() for step in steps]
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = [executor.submit(step) for step in steps]
+            return [future.result() for future in futures]
+    
+    def _authenticate_sudo(self) -> bool:
+        """Refresh sudo's credentials up front, returning whether that worked"""
+        try:
+            return self._spawn(["sudo", "-v"], 60, quiet=False) == 0
+        except Exception:  # sudo missing, password prompt timed out, ...
+            return False
+    
+    def run_script_with_progress(self, script_name: str, description: str, interactive: bool = False) -> bool:
         """Run a bash script with progress indication"""
         console.print(f"[info]Running {description}...[/info]")
         console.print("[dim]This will execute the corresponding bash script[/dim]")
         
         try:
-            result = subprocess.run(
-                ["bash", f"scripts/{script_name}"], 
-                cwd=Path.cwd(),
-                timeout=300  # 5 minutes timeout
-            )
-            if result.returncode == 0:
+            command = ["bash", self._scripts_dir / script_name]
+            # Scripts that ask questions keep the terminal. The others have
+            # their output collected into a panel showing its tail, once sudo
+            # is authenticated so no password prompt lands under that panel.
+            if interactive or not self._authenticate_sudo():
+                proc = subprocess.Popen(command, cwd=self._cwd)
+                self._wait_for_script(proc)
+            else:
+                from rich.live import Live
+                
+                proc = subprocess.Popen(
+                    command, 
+                    cwd=self._cwd, 
+                    stdin=subprocess.DEVNULL, 
+                    stdout=subprocess.PIPE, 
+                    stderr=subprocess.STDOUT, 
+                    text=True, 
+                    errors="replace"
+                )
+                output = deque(maxlen=self.SCRIPT_OUTPUT_LINES)
+                reader = threading.Thread(target=self._collect_output, args=(proc.stdout, output), daemon=True)
+                reader.start()
+                
+                def tail() -> Panel:
+                    lines = list(output)[-max(console.height - 8, 5):]
+                    return Panel(Text.from_ansi("\n".join(lines)), title=f"[cyan]{escape(description)}[/cyan]", title_align="left")
+                
+                with Live(console=console, get_renderable=tail, refresh_per_second=4):
+                    self._wait_for_script(proc)
+                    # Drain the last lines (usually the summary) before the final
+                    # frame; the bound only matters if children still hold the pipe
+                    reader.join(5)
+            
+            if proc.returncode == 0:
                 console.print(f"[success]✅ {description} completed successfully[/success]")
                 return True
             else:
@@ -868,174 +1418,282 @@ class PopOsDashboard:
             console.print(f"[error]❌ {description} failed: {e}[/error]")
             return False
     
+    def _wait_for_script(self, proc: subprocess.Popen):
+        """Wait for a script to exit, stopping it after 5 minutes or on Ctrl+C"""
+        try:
+            if not self._wait_for_exit(proc, 300):
+                self._stop_process(proc)
+                raise subprocess.TimeoutExpired(proc.args, 300)
+        except KeyboardInterrupt:
+            self._stop_process(proc)
+            raise
+        finally:
+            self._opt_status_ts = 0.0  # The script may have changed tuned settings
+    
+    @staticmethod
+    def _collect_output(stream, output: deque):
+        """Append each line read from stream to output until end of file"""
+        with stream:
+            for line in stream:
+                output.append(line.rstrip("\n"))
+    
+    @staticmethod
+    def _wait_for_exit(proc: subprocess.Popen, timeout: float) -> bool:
+        """Wait up to timeout seconds for proc to exit, returning whether it did"""
+        try:
+            # A pidfd becomes readable when the process exits, so this sleeps
+            # in the kernel instead of Popen.wait()'s waitpid() polling loop
+            pidfd = os.pidfd_open(proc.pid)
+        except (AttributeError, OSError):  # Python < 3.9 or kernel < 5.3
+            try:
+                proc.wait(timeout)
+                return True
+            except subprocess.TimeoutExpired:
+                return False
+        
+        try:
+            ready, _, _ = select.select([pidfd], [], [], timeout)
+        finally:
+            os.close(pidfd)
+        if ready:
+            proc.wait()
+        return bool(ready)
+    
+    @staticmethod
+    def _spawn(command: List[str], timeout: float, quiet: bool = True) -> int:
+        """Run command without capturing its output, returning its exit status"""
+        # posix_spawn() skips Popen's pipe and close_fds bookkeeping; steps
+        # that only need an exit status send the output to /dev/null instead
+        file_actions = []
+        if quiet:
+            file_actions = [
+                (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+                (os.POSIX_SPAWN_DUP2, 1, 2),
+            ]
+        pid = os.posix_spawnp(command[0], command, os.environ, file_actions=file_actions)
+        
+        try:
+            pidfd = os.pidfd_open(pid)
+        except (AttributeError, OSError):  # Python < 3.9 or kernel < 5.3
+            deadline = time.monotonic() + timeout
+            status = None
+            while True:
+                done, wait_status = os.waitpid(pid, os.WNOHANG)
+                if done:
+                    status = wait_status
+                    break
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(0.05)
+        else:
+            try:
+                ready, _, _ = select.select([pidfd], [], [], timeout)
+            finally:
+                os.close(pidfd)
+            status = os.waitpid(pid, 0)[1] if ready else None
+        
+        if status is None:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise subprocess.TimeoutExpired(command, timeout)
+        return os.waitstatus_to_exitcode(status)
+    
+    def _stop_process(self, proc: subprocess.Popen):
+        """Ask proc to terminate, killing it if it has not exited after 5 seconds"""
+        proc.terminate()
+        if not self._wait_for_exit(proc, 5):
+            proc.kill()
+            proc.wait()
+    
     def interactive_menu(self):
         """Modern interactive menu"""
+        # Everything but the quick status values is the same on every pass,
+        # so it is built once and the whole screen printed in one go
+        header = Panel.fit(
+            "[bold cyan]🚀 Pop-OS Optimizer Dashboard[/bold cyan]\n"
+            "[dim]Professional System Optimization Suite[/dim]",
+            border_style="cyan"
+        )
+        
+        status_table = Table(show_header=False, box=None, padding=(0, 2))
+        status_table.add_column("", style="cyan")
+        status_table.add_column("", style="white")
+        for label in ("🔥 CPU:", "💾 Memory:", "⚡ Governor:", "⏰ Uptime:"):
+            status_table.add_row(label, "")
+        status_panel = Panel(status_table, title="[cyan]Quick Status[/cyan]", title_align="left")
+        
+        menu_options = [
+            ("1", "🔴 Live Dashboard", "Real-time system monitoring"),
+            ("2", "📁 Create Backup", "Backup system configurations"),
+            ("3", "🔥 Optimize CPU", "CPU boost and governor settings"),
+            ("4", "💾 Optimize Memory", "Memory and swap optimization"),
+            ("5", "💿 Optimize SSD", "TRIM and I/O scheduler optimization"),
+            ("6", "🖥️ Optimize Desktop", "Animations and desktop settings"),
+            ("7", "⚙️ Optimize Services", "Disable unnecessary services"),
+            ("8", "🚀 Optimize Boot", "GRUB and boot time optimization"),
+            ("9", "📦 Install Software", "Install development tools"),
+            ("10", "📊 Setup Monitoring", "Install monitoring tools"),
+            ("11", "⚡ Full Optimization", "Complete system optimization"),
+            ("12", "🔍 Hardware Validation", "Check hardware compatibility"),
+            ("13", "📖 System Information", "Detailed system information"),
+            ("14", "⚙️ Configuration Presets", "Select optimization presets"),
+            ("15", "📚 View Documentation", "Show README and documentation"),
+            ("16", "🔄 Restore Backup", "Restore from previous backup"),
+            ("0", "👋 Exit", "Exit the application")
+        ]
+        menu = Text.from_markup("\n".join(
+            ["\n[bold cyan]📋 MENU OPTIONS:[/bold cyan]"] +
+            [f"  \\[{key}] [bold]{title}[/bold] - [dim]{desc}[/dim]" for key, title, desc in menu_options]
+        ))
+        
+        # Choice -> handler, looked up once per keypress
+        handlers = {
+            "1": self._menu_live_dashboard,
+            "2": self.create_backup_with_progress,
+            "3": self.optimize_cpu_with_progress,
+            "4": self.optimize_memory_with_progress,
+            "5": self.optimize_ssd_with_progress,
+            "6": self.optimize_desktop_with_progress,
+            "7": self.optimize_services_with_progress,
+            "8": partial(self.run_script_with_progress, "optimize_boot.sh", "Boot optimization"),
+            "9": partial(self.run_script_with_progress, "install_software_stack.sh", "Software installation", interactive=True),
+            "10": partial(self.run_script_with_progress, "setup_monitoring.sh", "Monitoring tools setup"),
+            "11": self._menu_full_optimization,
+            "12": self._menu_hardware_validation,
+            "13": self.show_detailed_system_info,
+            "14": self.configuration_presets_menu,
+            "15": self.show_documentation,
+            "16": self._menu_restore_backup,
+        }
+        
+        self.monitor.update_metrics()
+        self._start_metrics_refresher()
+        notice = None
+        
         while True:
             console.clear()
             
-            # Header
-            console.print(Panel.fit(
-                "[bold cyan]🚀 Pop-OS Optimizer Dashboard[/bold cyan]\n"
-                "[dim]Professional System Optimization Suite[/dim]",
-                border_style="cyan"
-            ))
-            
-            # Quick status overview
-            self.monitor.update_metrics()
-            self.check_optimization_status()
-            
-            metrics = self.metrics
-            status = self.optimization_status
-            
-            # Create quick status table
-            status_table = Table(show_header=False, box=None, padding=(0, 2))
-            status_table.add_column("", style="cyan")
-            status_table.add_column("", style="white")
-            
-            cpu_status = f"[success]{metrics.cpu_percent:.1f}%[/success]" if metrics.cpu_percent < 80 else f"[error]{metrics.cpu_percent:.1f}%[/error]"
-            mem_status = f"[success]{metrics.memory_percent:.1f}%[/success]" if metrics.memory_percent < 80 else f"[error]{metrics.memory_percent:.1f}%[/error]"
+            # Quick status overview; the metrics come from the background refresher
+            metrics = self.monitor.metrics
+            status = self.check_optimization_status()
             
-            status_table.add_row("🔥 CPU:", cpu_status)
-            status_table.add_row("💾 Memory:", mem_status)
-            status_table.add_row("⚡ Governor:", status.cpu_governor)
-            status_table.add_row("⏰ Uptime:", metrics.uptime)
+            cpu_color = lut_color(USAGE_COLORS, metrics.cpu_percent)
+            mem_color = lut_color(USAGE_COLORS, metrics.memory_percent)
+            self._update_row(status_table, 0, f"[{cpu_color}]{metrics.cpu_percent:.1f}%[/{cpu_color}]")
+            self._update_row(status_table, 1, f"[{mem_color}]{metrics.memory_percent:.1f}%[/{mem_color}]")
+            self._update_row(status_table, 2, status.cpu_governor)
+            self._update_row(status_table, 3, metrics.uptime)
             
-            console.print(Panel(status_table, title="[cyan]Quick Status[/cyan]", title_align="left"))
-            
-            # Menu options
-            console.print("\n[bold cyan]📋 MENU OPTIONS:[/bold cyan]")
-            
-            menu_options = [
-                ("1", "🔴 Live Dashboard", "Real-time system monitoring"),
-                ("2", "📁 Create Backup", "Backup system configurations"),
-                ("3", "🔥 Optimize CPU", "CPU boost and governor settings"),
-                ("4", "💾 Optimize Memory", "Memory and swap optimization"),
-                ("5", "💿 Optimize SSD", "TRIM and I/O scheduler optimization"),
-                ("6", "🖥️ Optimize Desktop", "Animations and desktop settings"),
-                ("7", "⚙️ Optimize Services", "Disable unnecessary services"),
-                ("8", "🚀 Optimize Boot", "GRUB and boot time optimization"),
-                ("9", "📦 Install Software", "Install development tools"),
-                ("10", "📊 Setup Monitoring", "Install monitoring tools"),
-                ("11", "⚡ Full Optimization", "Complete system optimization"),
-                ("12", "🔍 Hardware Validation", "Check hardware compatibility"),
-                ("13", "📖 System Information", "Detailed system information"),
-                ("14", "⚙️ Configuration Presets", "Select optimization presets"),
-                ("15", "📚 View Documentation", "Show README and documentation"),
-                ("16", "🔄 Restore Backup", "Restore from previous backup"),
-                ("0", "👋 Exit", "Exit the application")
-            ]
-            
-            for key, title, desc in menu_options:
-                console.print(f"  [{key}] [bold]{title}[/bold] - [dim]{desc}[/dim]")
+            console.print(Group(header, status_panel, menu))
+            # Feedback on the previous choice is shown with the redraw
+            # instead of holding the screen before it
+            if notice:
+                console.print(notice)
+                notice = None
             
             choice = Prompt.ask("\n[bold cyan]Select option[/bold cyan]", default="1")
             
-            if choice == "1":
-                console.print("[info]Starting live dashboard... Press Ctrl+C to return[/info]")
-                time.sleep(1)
-                try:
-                    self.running = True  # Reset running state
-                    self.run_live_dashboard()
-                except KeyboardInterrupt:
-                    console.print("\n[info]Returning to menu...[/info]")
-                    time.sleep(1)
-                    
-            elif choice == "2":
-                self.create_backup_with_progress()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "3":
-                self.optimize_cpu_with_progress()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "4":
-                self.optimize_memory_with_progress()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "5":
-                self.optimize_ssd_with_progress()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "6":
-                self.optimize_desktop_with_progress()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "7":
-                self.optimize_services_with_progress()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "8":
-                self.run_script_with_progress("optimize_boot.sh", "Boot optimization")
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "9":
-                self.run_script_with_progress("install_software_stack.sh", "Software installation")
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "10":
-                self.run_script_with_progress("setup_monitoring.sh", "Monitoring tools setup")
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "11":
-                if Confirm.ask("[warning]Run full optimization? This will modify system settings[/warning]"):
-                    console.print("[info]Running full optimization...[/info]")
-                    self.create_backup_with_progress()
-                    self.optimize_cpu_with_progress()
-                    self.optimize_memory_with_progress()
-                    self.optimize_ssd_with_progress()
-                    self.optimize_desktop_with_progress()
-                    self.optimize_services_with_progress()
-                    console.print("[success]✅ Full optimization completed![/success]")
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "12":
-                console.print("[info]Running hardware validation...[/info]")
-                subprocess.run(["bash", "scripts/hardware_validator.sh"])
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "13":
-                self.show_detailed_system_info()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "14":
-                self.configuration_presets_menu()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "15":
-                self.show_documentation()
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "16":
-                console.print("[info]Available backups:[/info]")
-                try:
-                    backup_dir = Path("backups")
-                    if backup_dir.exists():
-                        backups = list(backup_dir.glob("backup_*.tar.gz"))
-                        if backups:
-                            for i, backup in enumerate(sorted(backups)[-5:], 1):  # Show last 5
-                                console.print(f"  [{i}] {backup.name}")
-                            
-                            backup_choice = Prompt.ask("\nSelect backup number to restore (or 0 to cancel)", default="0")
-                            if backup_choice != "0" and backup_choice.isdigit():
-                                idx = int(backup_choice) - 1
-                                if 0 <= idx < len(backups):
-                                    if Confirm.ask(f"[warning]Restore backup {backups[idx].name}?[/warning]"):
-                                        self.run_script_with_progress("backup_safety.sh", f"Restore backup {backups[idx].name}")
-                        else:
-                            console.print("[warning]No backups found[/warning]")
-                    else:
-                        console.print("[warning]Backup directory not found[/warning]")
-                except Exception as e:
-                    console.print(f"[error]❌ Error listing backups: {e}[/error]")
-                Prompt.ask("\nPress Enter to continue")
-                
-            elif choice == "0":
+            if choice == "0":
                 console.print("[success]👋 Goodbye![/success]")
+                self._stop_metrics_refresher()
                 break
+            
+            handler = handlers.get(choice)
+            if handler is None:
+                notice = f"\n[error]❌ Invalid option: {escape(choice)}[/error]"
+                continue
+            
+            handler()
+            # The live dashboard returns straight to the menu
+            if choice != "1":
+                self._pause()
+    
+    @staticmethod
+    def _pause():
+        """Wait for Enter; a plain readline, as there is no answer to parse"""
+        sys.stdout.write("\nPress Enter to continue: ")
+        sys.stdout.flush()
+        sys.stdin.readline()
+    
+    def _start_metrics_refresher(self):
+        """Refresh the system metrics every second on a background thread"""
+        stop = threading.Event()
+        thread = threading.Thread(target=self._sample_periodically, args=(self.monitor.update_metrics, lambda: 1.0, stop), daemon=True)
+        thread.start()
+        self._metrics_refresher = (thread, stop)
+    
+    def _stop_metrics_refresher(self):
+        """Stop the background metrics refresher and wait for it to exit"""
+        if self._metrics_refresher is not None:
+            thread, stop = self._metrics_refresher
+            stop.set()
+            thread.join()
+            self._metrics_refresher = None
+    
+    def _menu_live_dashboard(self):
+        """Run the live dashboard until Ctrl+C"""
+        console.print("[info]Starting live dashboard... Press Ctrl+C to return[/info]")
+        # The dashboard samples metrics itself, and its timer signal must only
+        # reach threads that block it, so the menu's refresher is paused
+        self._stop_metrics_refresher()
+        try:
+            self.running = True  # Reset running state
+            self.run_live_dashboard()
+        except KeyboardInterrupt:
+            console.print("\n[info]Returning to menu...[/info]")
+        finally:
+            self._start_metrics_refresher()
+    
+    def _menu_full_optimization(self):
+        """Back up, then run every optimization step"""
+        if Confirm.ask("[warning]Run full optimization? This will modify system settings[/warning]"):
+            console.print("[info]Running full optimization...[/info]")
+            self.create_backup_with_progress()
+            # Each step tunes its own settings (sysfs, sysctl, TRIM and
+            # I/O scheduler, gsettings, systemd units) and mostly waits
+            # on subprocesses, so they run side by side
+            self.run_steps([
+                self.optimize_cpu_with_progress,
+                self.optimize_memory_with_progress,
+                self.optimize_ssd_with_progress,
+                self.optimize_desktop_with_progress,
+                self.optimize_services_with_progress,
+            ])
+            console.print("[success]✅ Full optimization completed![/success]")
+    
+    def _menu_hardware_validation(self):
+        """Run the hardware validator script"""
+        console.print("[info]Running hardware validation...[/info]")
+        subprocess.run(["bash", self._scripts_dir / "hardware_validator.sh"], cwd=self._cwd)
+    
+    def _menu_restore_backup(self):
+        """List the newest backups and restore the selected one"""
+        console.print("[info]Available backups:[/info]")
+        try:
+            # scandir() yields each entry's stat from the directory read
+            with os.scandir(self.backup_dir) as entries:
+                candidates = [
+                    (entry.stat().st_mtime, entry.name) for entry in entries
+                    if entry.name.startswith("backup_") and entry.name.endswith(".tar.gz")
+                ]
+            # Newest 5, numbered in the order they are listed
+            backups = [name for _, name in heapq.nlargest(5, candidates)]
+            if backups:
+                for i, name in enumerate(backups, 1):
+                    console.print(f"  [{i}] {name}")
                 
+                backup_choice = Prompt.ask("\nSelect backup number to restore (or 0 to cancel)", default="0")
+                if backup_choice != "0" and backup_choice.isdigit():
+                    idx = int(backup_choice) - 1
+                    if 0 <= idx < len(backups):
+                        if Confirm.ask(f"[warning]Restore backup {backups[idx]}?[/warning]"):
+                            self.run_script_with_progress("backup_safety.sh", f"Restore backup {backups[idx]}", interactive=True)
             else:
-                console.print("[error]❌ Invalid option[/error]")
-                time.sleep(1)
+                console.print("[warning]No backups found[/warning]")
+        except FileNotFoundError:
+            console.print("[warning]Backup directory not found[/warning]")
+        except Exception as e:
+            console.print(f"[error]❌ Error listing backups: {e}[/error]")
     
     def show_detailed_system_info(self):
         """Show detailed system information"""
@@ -1046,61 +1704,126 @@ class PopOsDashboard:
         info_table.add_column("Property", style="cyan", min_width=20)
         info_table.add_column("Value", style="white")
         
+        rows = []
+        
         # CPU info
-        try:
-            cpu_info = self.run_command(["lscpu"], capture_output=True)
-            for line in cpu_info.stdout.splitlines():
-                if "Model name:" in line:
-                    cpu_model = line.split(":", 1)[1].strip()
-                    info_table.add_row("🔥 CPU Model", cpu_model)
-                elif "CPU MHz:" in line:
-                    cpu_mhz = line.split(":", 1)[1].strip()
-                    info_table.add_row("⚡ CPU Frequency", f"{cpu_mhz} MHz")
-        except:
-            pass
+        cpu_model = self._cached("cpu_model", 3600, self._read_cpu_model)
+        if cpu_model:
+            rows.append((SYSINFO_CPU_MODEL, cpu_model))
+        
+        cpu_mhz = self._cached("cpu_mhz", 1.0, self._read_cpu_mhz)
+        if cpu_mhz is not None:
+            rows.append((SYSINFO_CPU_FREQ, f"{cpu_mhz} MHz"))
         
         # Memory info
-        memory = psutil.virtual_memory()
-        info_table.add_row("💾 Total Memory", f"{memory.total / (1024**3):.1f} GB")
-        info_table.add_row("💾 Available Memory", f"{memory.available / (1024**3):.1f} GB")
+        memory = self._cached("vmem", 0.5, psutil.virtual_memory)
+        rows.append((SYSINFO_TOTAL_MEM, f"{memory.total * GB_INV:.1f} GB"))
+        rows.append((SYSINFO_AVAILABLE_MEM, f"{memory.available * GB_INV:.1f} GB"))
+        
+        for row in rows:
+            info_table.add_row(*row)
         
         # Disk info
+        panels = [Panel(info_table, title=self._title_sysinfo)]
+        disk_info = self._cached("block_devices", 60, self._read_block_devices)
+        if disk_info.row_count:
+            panels.append(Panel(disk_info, title=self._title_storage))
+        console.print(Group(*panels))
+    
+    @staticmethod
+    def _read_cpu_model() -> Optional[str]:
+        """CPU model name from /proc/cpuinfo, or None if it is not listed"""
+        try:
+            with open("/proc/cpuinfo") as f:
+                match = CPUINFO_MODEL_RE.search(f.read())
+        except OSError:
+            return None
+        return match.group(1).strip() if match else None
+    
+    def _read_cpu_mhz(self) -> Optional[int]:
+        """Current frequency of cpu0 in MHz, or None if it cannot be read"""
         try:
-            disk_info = self.run_command(["lsblk", "-d", "-o", "NAME,SIZE,MODEL"], capture_output=True)
-            console.print(Panel(info_table, title="[cyan]💻 System Information[/cyan]"))
-            console.print(Panel(disk_info.stdout, title="[cyan]💿 Storage Devices[/cyan]"))
-        except:
-            console.print(Panel(info_table, title="[cyan]💻 System Information[/cyan]"))
+            with open(self.CUR_FREQ_PATH) as f:
+                return int(f.read()) // 1000  # kHz
+        except (OSError, ValueError):
+            pass
+        
+        # No cpufreq driver (e.g. VMs): fall back to the first cpuinfo entry
+        try:
+            with open("/proc/cpuinfo") as f:
+                for line in f:
+                    if line.startswith("cpu MHz"):
+                        return int(float(line.split(":", 1)[1]))
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    @staticmethod
+    def _read_block_devices() -> Table:
+        """List physical block devices from sysfs, like `lsblk -d -o NAME,SIZE,MODEL`"""
+        table = Table(box=None, padding=(0, 1))
+        table.add_column("NAME")
+        table.add_column("SIZE", justify="right")
+        table.add_column("MODEL")
+        
+        for block in sorted(Path("/sys/block").iterdir()):
+            # Virtual devices (loop, zram, device-mapper) have no backing device
+            if not (block / "device").exists():
+                continue
+            try:
+                size = int((block / "size").read_text()) * 512  # Always 512-byte sectors
+            except (OSError, ValueError):
+                continue
+            try:
+                model = (block / "device" / "model").read_text().strip()
+            except OSError:
+                model = ""
+            table.add_row(block.name, format_size(size), model)
+        return table
 
     def get_current_preset(self):
         """Get current preset from config file"""
         try:
-            config_path = Path("scripts/config.sh")
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    for line in f:
-                        if line.strip().startswith('PRESET='):
-                            preset = line.split('=')[1].strip().strip('"')
-                            return preset
-        except:
+            # Only re-read the file when it changed since the last call
+            st = os.stat(self.PRESET_CONFIG_PATH)
+            stamp = (st.st_mtime_ns, st.st_size)
+            if self._preset_cache and self._preset_cache[0] == stamp:
+                return self._preset_cache[1]
+            
+            with open(self.PRESET_CONFIG_PATH, 'rb') as f:
+                match = PRESET_VALUE_RE.search(f.read())
+            preset = match.group(1).split(b'=')[0].strip().strip(b'"').decode() if match else "unknown"
+            self._preset_cache = (stamp, preset)
+            return preset
+        except (OSError, UnicodeDecodeError):
             pass
         return "unknown"
 
     def set_preset(self, preset_name):
         """Set preset in config file"""
+        config_path = Path(self.PRESET_CONFIG_PATH)
+        self._preset_cache = None
         try:
-            config_path = Path("scripts/config.sh")
-            if config_path.exists():
-                with open(config_path, 'r') as f:
-                    content = f.read()
-                
-                # Replace the PRESET line
-                import re
-                content = re.sub(r'^PRESET=.*$', f'PRESET="{preset_name}"', content, flags=re.MULTILINE)
-                
-                with open(config_path, 'w') as f:
+            content = config_path.read_bytes()
+            
+            # Replace the PRESET line; config.sh assigns it once, so the scan stops there
+            line = f'PRESET="{preset_name}"'.encode()
+            content = PRESET_LINE_RE.sub(lambda _: line, content, count=1)
+            
+            # Write a sibling file and rename it over the config, so readers
+            # (and a crash mid-write) never see a truncated config.sh
+            with tempfile.NamedTemporaryFile(dir=config_path.parent, prefix=".config.sh.", delete=False) as f:
+                try:
                     f.write(content)
-                return True
+                    f.close()
+                    shutil.copymode(config_path, f.name)
+                    os.replace(f.name, config_path)
+                except BaseException:
+                    os.unlink(f.name)  # Leave no stray temporary file behind
+                    raise
+            return True
+        except FileNotFoundError:
+            pass
         except Exception as e:
             console.print(f"[error]❌ Error setting preset: {e}[/error]")
         return False
@@ -1112,8 +1835,9 @@ class PopOsDashboard:
         try:
             readme_path = Path("README.md")
             if readme_path.exists():
+                # Show first part of README, reading no further than needed
                 with open(readme_path, 'r') as f:
-                    content = f.read()
+                    readme_text = "".join(islice(f, 30)).removesuffix("\n")  # First 30 lines
                 
                 # Display README content
                 console.print(Panel.fit(
@@ -1121,19 +1845,12 @@ class PopOsDashboard:
                     border_style="cyan"
                 ))
                 
-                # Show first part of README
-                lines = content.split('\n')[:30]  # First 30 lines
-                readme_text = '\n'.join(lines)
-                
                 console.print(Panel(readme_text, title="[cyan]README.md[/cyan]"))
                 
             changelog_path = Path("docs/CHANGELOG.md")
             if changelog_path.exists():
                 with open(changelog_path, 'r') as f:
-                    content = f.read()
-                
-                lines = content.split('\n')[:20]  # First 20 lines
-                changelog_text = '\n'.join(lines)
+                    changelog_text = "".join(islice(f, 20)).removesuffix("\n")  # First 20 lines
                 
                 console.print(Panel(changelog_text, title="[cyan]CHANGELOG.md[/cyan]"))
                 
@@ -1153,74 +1870,19 @@ class PopOsDashboard:
             border_style="cyan"
         ))
         
-        # Preset descriptions
-        presets = {
-            "working": {
-                "name": "🖥️  Working",
-                "desc": "Optimized for development and office work",
-                "details": [
-                    "• Performance CPU governor",
-                    "• Moderate memory settings", 
-                    "• Development tools included",
-                    "• Desktop animations disabled"
-                ]
-            },
-            "gaming": {
-                "name": "🎮 Gaming", 
-                "desc": "Optimized for maximum gaming performance",
-                "details": [
-                    "• Performance CPU governor",
-                    "• Aggressive memory settings",
-                    "• Gaming tools included", 
-                    "• Minimal background services"
-                ]
-            },
-            "server": {
-                "name": "🖥️  Server",
-                "desc": "Optimized for server/headless environments",
-                "details": [
-                    "• Balanced CPU for server workloads",
-                    "• Large network buffers",
-                    "• Server tools included",
-                    "• Desktop services disabled"
-                ]
-            },
-            "conservative": {
-                "name": "🛡️  Conservative",
-                "desc": "Minimal, safe optimizations",
-                "details": [
-                    "• Safe CPU settings",
-                    "• Minimal system changes",
-                    "• Essential tools only",
-                    "• Maximum compatibility"
-                ]
-            },
-            "custom": {
-                "name": "⚙️  Custom",
-                "desc": "Manual configuration of all settings",
-                "details": [
-                    "• Configure each option manually",
-                    "• Full control over optimizations",
-                    "• Advanced users only"
-                ]
-            }
-        }
-        
         console.print("\n[bold cyan]📋 Available Presets:[/bold cyan]\n")
         
-        for i, (preset_key, preset_info) in enumerate(presets.items(), 1):
+        entries = []
+        for i, (preset_key, preset_info) in enumerate(PRESETS.items(), 1):
             status = " [bold green](Current)[/bold green]" if preset_key == current_preset else ""
-            console.print(f"[bold cyan]{i}.[/bold cyan] {preset_info['name']}{status}")
-            console.print(f"   [dim]{preset_info['desc']}[/dim]")
-            for detail in preset_info['details']:
-                console.print(f"   [dim]{detail}[/dim]")
-            console.print()
-        
-        console.print("[bold cyan]0.[/bold cyan] [bold]Return to main menu[/bold]")
+            entries.append(Text.from_markup(f"[bold cyan]{i}.[/bold cyan] {preset_info['name']}{status}"))
+            entries.append(PRESET_DETAILS[preset_key])
+        entries.append(Text.from_markup("[bold cyan]0.[/bold cyan] [bold]Return to main menu[/bold]"))
+        console.print(Group(*entries))
         
         choice = Prompt.ask("\n[bold cyan]Select preset[/bold cyan]", default="0")
         
-        preset_list = list(presets.keys())
+        preset_list = list(PRESETS)
         
         if choice == "0":
             return
@@ -1245,31 +1907,61 @@ class PopOsDashboard:
         except ValueError:
             console.print("[error]❌ Invalid input[/error]")
 
+CLI_FLAGS = {
+    "--dashboard": "Start live dashboard directly",
+    "--optimize": "Run full optimization",
+    "--backup": "Create backup only",
+    "--status": "Show status only",
+    "--sequential": "Run --optimize steps one at a time",
+}
+
+def parse_args(argv: List[str]):
+    """Parse command line flags, only loading argparse for options with values, --help or bad input"""
+    if all(arg in CLI_FLAGS for arg in argv):
+        return types.SimpleNamespace(refresh_rate=None, **{flag[2:]: flag in argv for flag in CLI_FLAGS})
+    
+    import argparse
+    
+    def positive_seconds(value: str) -> float:
+        seconds = float(value)
+        if not (math.isfinite(seconds) and seconds > 0):
+            raise argparse.ArgumentTypeError(f"must be a positive number of seconds, got {value!r}")
+        return seconds
+    
+    parser = argparse.ArgumentParser(description="Pop-OS Optimizer Dashboard - Professional Edition")
+    for flag, help_text in CLI_FLAGS.items():
+        parser.add_argument(flag, action="store_true", help=help_text)
+    parser.add_argument("--refresh-rate", type=positive_seconds, metavar="SECONDS",
+                        help="Fixed live dashboard refresh interval (default: adapts to activity)")
+    return parser.parse_args(argv)
+
 def main():
     """Main application entry point"""
-    parser = argparse.ArgumentParser(description="Pop-OS Optimizer Dashboard - Professional Edition")
-    parser.add_argument("--dashboard", action="store_true", help="Start live dashboard directly")
-    parser.add_argument("--optimize", action="store_true", help="Run full optimization")
-    parser.add_argument("--backup", action="store_true", help="Create backup only")
-    parser.add_argument("--status", action="store_true", help="Show status only")
-    
-    args = parser.parse_args()
+    args = parse_args(sys.argv[1:])
     
     dashboard = PopOsDashboard()
+    if args.refresh_rate is not None:
+        dashboard.refresh_rate = max(args.refresh_rate, PopOsDashboard.MIN_REFRESH)
+        dashboard.adaptive_refresh = False
     
     if args.backup:
         dashboard.create_backup_with_progress()
     elif args.optimize:
         console.print("[info]🚀 Running full optimization...[/info]")
         dashboard.create_backup_with_progress()
-        dashboard.optimize_cpu_with_progress()
-        dashboard.optimize_memory_with_progress()
+        # CPU and memory tuning touch disjoint sysfs/sysctl keys
+        dashboard.run_steps(
+            [dashboard.optimize_cpu_with_progress, dashboard.optimize_memory_with_progress],
+            sequential=args.sequential
+        )
         console.print("[success]✅ Full optimization completed![/success]")
     elif args.status:
-        dashboard.monitor.update_metrics()
-        dashboard.check_optimization_status()
-        console.print(dashboard.create_system_metrics_panel())
-        console.print(dashboard.create_optimization_status_panel())
+        metrics = dashboard.monitor.update_metrics()
+        status = dashboard.check_optimization_status()
+        console.print(Group(
+            dashboard.create_system_metrics_panel(metrics),
+            dashboard.create_optimization_status_panel(status)
+        ))
     elif args.dashboard:
         dashboard.run_live_dashboard()
     else:
@@ -1282,6 +1974,6 @@ if __name__ == "__main__":
         console.print("\n[info]👋 Interrupted by user[/info]")
         sys.exit(0)
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
-        console.print("❌ Fatal error:", str(e))
+        logger.error("Fatal error: %s", e)
+        console.print(f"[error]❌ Fatal error: {e}[/error]")
         sys.exit(1) 
\ No newline at end of file